@@ -1,9 +1,21 @@
 """Gmail Wrapper - A Python module for interacting with the Gmail API."""
 
-from .api import GmailAPICaller, gmail_service
+import sys
+
+if sys.platform != "win32":
+    # Optional drop-in event loop (pip install gmailwrapper[fast]);
+    # cuts per-callback overhead on the async request fan-out paths.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+from .api import GmailAPICaller
 from .auth import GmailAuthenticator
 from .client import GmailHTTPClient
-from .config import GmailConfig
+from .config import DEFAULT_CONFIG, GmailConfig
 from .exceptions import (
     GmailWrapperError,
     GmailAuthError,
@@ -20,6 +32,16 @@ __version__ = "1.0.0b0"
 # For backwards compatibility
 GmailWrapper = GmailAPICaller
 
+
+def __getattr__(name):
+    """Lazily expose the shared service instance (PEP 562)."""
+    if name == "gmail_service":
+        from .api import gmail_service
+
+        return gmail_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "GmailAPICaller",
     "GmailWrapper",  # backwards compatibility
@@ -27,6 +49,7 @@ __all__ = [
     "GmailAuthenticator",
     "GmailHTTPClient",
     "GmailConfig",
+    "DEFAULT_CONFIG",
     "GmailMessages",
     "GmailDrafts",
     "GmailThreads",
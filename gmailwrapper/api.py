@@ -7,27 +7,30 @@ from typing import Any
 
 from .auth import GmailAuthenticator
 from .client import GmailHTTPClient
-from .config import GmailConfig
+from .config import DEFAULT_CONFIG, GmailConfig
 from .resources import GmailMessages, GmailDrafts, GmailThreads
 
-try:
-    from backend.logger import logger
-except ImportError:
-    from loguru import logger
-
 
 class GmailAPICaller:
     """
     A class to interact with the Gmail API using httpx.
     """
 
-    def __init__(self):
+    def __init__(self, config: GmailConfig = DEFAULT_CONFIG):
         """
         Initialize the Gmail API caller with modular components.
+
+        Args:
+            config: API configuration; defaults to the shared immutable
+                DEFAULT_CONFIG instance
         """
-        self.config = GmailConfig()
+        self.config = config
         self.authenticator = GmailAuthenticator()
-        self.client = GmailHTTPClient(self.authenticator, self.config.BASE_URL)
+        self.client = GmailHTTPClient(
+            self.authenticator,
+            self.config.BASE_URL,
+            max_retries=self.config.MAX_RETRIES,
+        )
 
         # Resource handlers
         self.messages = GmailMessages(self.client, self.config)
@@ -68,7 +71,10 @@ class GmailAPICaller:
         )
 
     async def get_drafts(
-        self, headers: dict[str, str] | None = None, details: bool = False
+        self,
+        headers: dict[str, str] | None = None,
+        details: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all drafts.
@@ -76,14 +82,20 @@ class GmailAPICaller:
         Args:
             headers: Additional headers
             details: Whether to get full draft details
+            fields: Partial-response field mask
 
         Returns:
             list[dict[str, Any]]: List of drafts
         """
-        return await self.drafts.get_all(headers=headers, details=details)
+        return await self.drafts.get_all(
+            headers=headers, details=details, fields=fields
+        )
 
     async def get_draft(
-        self, draft_id: str, headers: dict[str, str] | None = None
+        self,
+        draft_id: str,
+        headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """
         Get a specific draft by ID.
@@ -91,11 +103,14 @@ class GmailAPICaller:
         Args:
             draft_id: Draft ID
             headers: Additional headers
+            fields: Partial-response field mask
 
         Returns:
             dict[str, Any]: Draft data
         """
-        return await self.drafts.get_by_id(draft_id, headers=headers)
+        return await self.drafts.get_by_id(
+            draft_id, headers=headers, fields=fields
+        )
 
     async def create_draft(
         self, message: dict[str, str], headers: dict[str, str] | None = None
@@ -128,7 +143,10 @@ class GmailAPICaller:
         return await self.messages.send(message, headers=headers)
 
     async def get_messages(
-        self, headers: dict[str, str] | None = None, details: bool = False
+        self,
+        headers: dict[str, str] | None = None,
+        details: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all messages.
@@ -136,14 +154,20 @@ class GmailAPICaller:
         Args:
             headers: Additional headers
             details: Whether to get full message details
+            fields: Partial-response field mask
 
         Returns:
             list[dict[str, Any]]: List of messages
         """
-        return await self.messages.get_all(headers=headers, details=details)
+        return await self.messages.get_all(
+            headers=headers, details=details, fields=fields
+        )
 
     async def get_message(
-        self, message_id: str, headers: dict[str, str] | None = None
+        self,
+        message_id: str,
+        headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """
         Get a specific message by ID.
@@ -151,11 +175,14 @@ class GmailAPICaller:
         Args:
             message_id: Message ID
             headers: Additional headers
+            fields: Partial-response field mask
 
         Returns:
             dict[str, Any]: Message data
         """
-        return await self.messages.get_by_id(message_id, headers=headers)
+        return await self.messages.get_by_id(
+            message_id, headers=headers, fields=fields
+        )
 
     async def delete_draft(
         self, draft_id: str, headers: dict[str, str] | None = None
@@ -231,9 +258,26 @@ class GmailAPICaller:
         """
         return self.messages.parse_message(raw_content)
 
+    async def get_msg_from_str_async(
+        self, raw_content: str
+    ) -> email.message.Message:
+        """
+        Parse raw message content in a worker thread.
+
+        Args:
+            raw_content: Raw message content
+
+        Returns:
+            email.message.Message: Parsed message object
+        """
+        return await self.messages.parse_message_async(raw_content)
+
     # Thread methods
     async def get_threads(
-        self, headers: dict[str, str] | None = None, details: bool = False
+        self,
+        headers: dict[str, str] | None = None,
+        details: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all threads.
@@ -241,14 +285,20 @@ class GmailAPICaller:
         Args:
             headers: Additional headers
             details: Whether to get full thread details
+            fields: Partial-response field mask
 
         Returns:
             list[dict[str, Any]]: List of threads
         """
-        return await self.threads.get_all(headers=headers, details=details)
+        return await self.threads.get_all(
+            headers=headers, details=details, fields=fields
+        )
 
     async def get_thread(
-        self, thread_id: str, headers: dict[str, str] | None = None
+        self,
+        thread_id: str,
+        headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """
         Get a specific thread by ID.
@@ -256,11 +306,14 @@ class GmailAPICaller:
         Args:
             thread_id: Thread ID
             headers: Additional headers
+            fields: Partial-response field mask
 
         Returns:
             dict[str, Any]: Thread data
         """
-        return await self.threads.get_by_id(thread_id, headers=headers)
+        return await self.threads.get_by_id(
+            thread_id, headers=headers, fields=fields
+        )
 
     async def delete_thread(
         self, thread_id: str, headers: dict[str, str] | None = None
@@ -287,4 +340,20 @@ class GmailAPICaller:
         await self.threads.undelete(thread_id, headers=headers)
 
 
-gmail_service = GmailAPICaller()
+_gmail_service = None
+
+
+def __getattr__(name: str) -> GmailAPICaller:
+    """
+    Lazily create the shared ``gmail_service`` instance (PEP 562).
+
+    Instantiating at import time forced credential/token file access on
+    every ``import gmailwrapper``; deferring it keeps imports free of
+    I/O and lets tests and workers run without creds on disk.
+    """
+    if name == "gmail_service":
+        global _gmail_service
+        if _gmail_service is None:
+            _gmail_service = GmailAPICaller()
+        return _gmail_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
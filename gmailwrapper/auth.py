@@ -2,7 +2,10 @@
 Gmail authentication handler.
 """
 
+import asyncio
 import os
+from datetime import datetime, timedelta
+
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -22,6 +25,8 @@ class GmailAuthenticator:
     def __init__(self):
         """Initialize the authenticator."""
         self._credentials = None
+        self._header_cache = None
+        self._refresh_lock = asyncio.Lock()
 
     def get_credentials(self) -> Credentials:
         """
@@ -73,22 +78,80 @@ class GmailAuthenticator:
             raise GmailCredentialsError(f"OAuth flow failed: {e}")
 
     def _save_token(self, credentials: Credentials) -> None:
-        """Save credentials to token file."""
+        """Save credentials to token file atomically, if changed."""
         try:
-            with open(TOKEN_PATH, "w") as token:
-                token.write(credentials.to_json())
+            new_json = credentials.to_json()
+
+            if os.path.exists(TOKEN_PATH):
+                with open(TOKEN_PATH) as token:
+                    if token.read() == new_json:
+                        return
+
+            tmp_path = f"{TOKEN_PATH}.tmp"
+            with open(tmp_path, "w") as token:
+                token.write(new_json)
+            os.replace(tmp_path, TOKEN_PATH)
         except Exception as e:
             logger.warning(f"Failed to save token: {e}")
 
+    def _headers_stale(self) -> bool:
+        """Check whether cached headers are invalid or near expiry."""
+        credentials = self._credentials
+        if credentials is None or not credentials.valid:
+            return True
+        if credentials.expiry is None:
+            return False
+        return credentials.expiry - datetime.utcnow() < timedelta(seconds=60)
+
     def get_auth_headers(self) -> dict[str, str]:
         """
         Get authorization headers for API requests.
 
+        The header dict is cached and reused until the underlying token
+        is within 60 seconds of expiry, so hot request paths don't
+        rebuild it per call.
+
         Returns:
             dict[str, str]: Headers with authorization token.
         """
+        if self._header_cache is not None and not self._headers_stale():
+            return self._header_cache
+
         credentials = self.get_credentials()
-        return {
+        self._header_cache = {
             "Authorization": f"Bearer {credentials.token}",
             "Content-Type": "application/json",
         }
+        return self._header_cache
+
+    def invalidate_headers(self) -> None:
+        """
+        Drop cached credentials and headers.
+
+        The next header request re-reads the token file and refreshes
+        if needed - used when the API rejects a token early (401).
+        """
+        self._header_cache = None
+        self._credentials = None
+
+    async def get_auth_headers_async(self) -> dict[str, str]:
+        """
+        Get authorization headers without blocking the event loop.
+
+        Token refreshes run in the default thread executor, and
+        concurrent callers coalesce behind one refresh via a lock
+        instead of stampeding the token endpoint. The cached-header
+        fast path stays entirely on the event loop.
+
+        Returns:
+            dict[str, str]: Headers with authorization token.
+        """
+        if self._header_cache is not None and not self._headers_stale():
+            return self._header_cache
+
+        async with self._refresh_lock:
+            if self._header_cache is None or self._headers_stale():
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.get_auth_headers
+                )
+        return self._header_cache
@@ -2,12 +2,21 @@
 HTTP client for Gmail API interactions.
 """
 
+import asyncio
 import os
+import random
+import re
+import uuid
+from datetime import datetime, timezone
+from email.parser import BytesParser
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
+import orjson
 
 from .auth import GmailAuthenticator
+from .consts import GMAIL_CONCURRENCY, GMAIL_POOL
 from .exceptions import GmailAPIError, GmailRequestError
 
 try:
@@ -15,39 +24,169 @@ try:
 except ImportError:
     from loguru import logger
 
+BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+BATCH_MAX_REQUESTS = 100
+
+MAX_RETRIES = 6
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+_CONTENT_ID_RE = re.compile(r"item(\d+)")
+
+_VALID_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+_SHARED_TRANSPORT: httpx.AsyncHTTPTransport | None = None
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """
+    Parse a Retry-After header into seconds.
+
+    Servers may send either delta-seconds or an HTTP-date (RFC 9110);
+    malformed or missing values fall back to 0 so the jittered delay
+    applies instead of an exception escaping the retry loop.
+    """
+    if not value:
+        return 0.0
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        target = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if target.tzinfo is None:
+        target = target.replace(tzinfo=timezone.utc)
+    return max(
+        0.0,
+        (target - datetime.now(timezone.utc)).total_seconds(),
+    )
+
+
+def _get_shared_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Lazily create the process-wide connection-pool transport.
+
+    Every non-proxied client rides on this one transport, so all
+    GmailHTTPClient instances share a single HTTP/2 connection pool
+    instead of each holding their own.
+    """
+    global _SHARED_TRANSPORT
+    if _SHARED_TRANSPORT is None:
+        _SHARED_TRANSPORT = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=GMAIL_POOL,
+                max_keepalive_connections=50,
+                keepalive_expiry=300,
+            ),
+            retries=2,
+        )
+    return _SHARED_TRANSPORT
+
+
+async def aclose_shared_transport() -> None:
+    """Close the shared transport; call once at process shutdown."""
+    global _SHARED_TRANSPORT
+    if _SHARED_TRANSPORT is not None:
+        await _SHARED_TRANSPORT.aclose()
+        _SHARED_TRANSPORT = None
+
 
 class GmailHTTPClient:
     """Handles HTTP requests to Gmail API."""
 
-    def __init__(self, authenticator: GmailAuthenticator, base_url: str):
+    def __init__(
+        self,
+        authenticator: GmailAuthenticator,
+        base_url: str,
+        max_retries: int = MAX_RETRIES,
+    ):
         """
         Initialize the HTTP client.
 
         Args:
             authenticator: Gmail authenticator instance
             base_url: Base URL for Gmail API
+            max_retries: Attempt budget for transient HTTP errors
+                (total attempts, so it must be at least 1)
+
+        Raises:
+            ValueError: When max_retries is less than 1
         """
+        if max_retries < 1:
+            raise ValueError(
+                f"max_retries must be at least 1, got {max_retries}"
+            )
         self.authenticator = authenticator
         self.base_url = base_url
-        self._client = None
+        self.max_retries = max_retries
+        self._sem = asyncio.Semaphore(GMAIL_CONCURRENCY)
+        self._client: httpx.AsyncClient | None = None
+        self._owns_transport = False
 
     def _get_client(self, proxy: bool = False) -> httpx.AsyncClient:
-        """Get or create httpx client."""
+        """
+        Get or lazily create this instance's httpx client.
+
+        The client itself is per-instance (cheap: headers, cookies,
+        timeouts) but rides on the module-level shared transport, so
+        all instances pool connections together. Proxied clients get a
+        private transport since their routes differ.
+        """
         if self._client is None:
-            headers = self.authenticator.get_auth_headers()
-            kwargs = {"headers": headers}
-
-            if proxy:
-                proxy_url = os.environ.get("HTTP_PROXY")
-                if proxy_url:
-                    kwargs["proxies"] = {
-                        "http://": proxy_url,
-                        "https://": proxy_url,
-                    }
+            kwargs = {
+                # httpx merges relative request paths against base_url
+                # once at the URL layer, replacing per-call f-string
+                # URL assembly and reparsing. Absolute URLs (the batch
+                # endpoint) still pass through untouched.
+                "base_url": self.base_url,
+                "timeout": httpx.Timeout(30.0, connect=10.0, pool=5.0),
+            }
+
+            proxy_url = os.environ.get("HTTP_PROXY") if proxy else None
+            if proxy_url:
+                # httpx 0.28 dropped the proxies kwarg; route through
+                # a private proxied transport, tuned like the shared
+                # one.
+                kwargs["transport"] = httpx.AsyncHTTPTransport(
+                    proxy=proxy_url, http2=True, retries=2
+                )
+                self._owns_transport = True
+            else:
+                # Pooling/HTTP2 config lives on the transport, which
+                # also retries failed connects; HTTP-status retries
+                # stay in request().
+                kwargs["transport"] = _get_shared_transport()
+                self._owns_transport = False
 
             self._client = httpx.AsyncClient(**kwargs)
         return self._client
 
+    async def _stream_body(self, response: httpx.Response) -> bytearray:
+        """
+        Read a streamed response body into a single buffer.
+
+        Error statuses are read and raised before the body is
+        accumulated, so failed requests never buffer large payloads.
+
+        Args:
+            response: Open streaming response
+
+        Returns:
+            bytearray: The accumulated response body
+        """
+        if response.status_code >= 400:
+            await response.aread()
+            response.raise_for_status()
+
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
+        return buffer
+
     async def request(
         self,
         method: str,
@@ -55,7 +194,8 @@ class GmailHTTPClient:
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
+        parse_response: bool = True,
+    ) -> dict[str, Any] | None:
         """
         Make a request to the Gmail API.
 
@@ -65,42 +205,270 @@ class GmailHTTPClient:
             params: Query parameters
             data: JSON data for request body
             headers: Additional headers
+            parse_response: Whether to decode the response body; pass
+                False on calls whose result is discarded (trash,
+                untrash) to skip the JSON parse
 
         Returns:
-            dict[str, Any]: API response data
+            dict[str, Any] | None: API response data, or None when
+                parse_response is False or the body is empty
 
         Raises:
             GmailAPIError: When API returns an error
             GmailRequestError: When HTTP request fails
         """
-        client = self._get_client()
-        request_headers = self.authenticator.get_auth_headers().copy()
+        if method not in _VALID_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
+        auth_headers = await self.authenticator.get_auth_headers_async()
+
+        # httpx doesn't mutate the passed headers, so only build a
+        # fresh dict when per-call headers need merging in.
         if headers:
-            request_headers.update(headers)
+            request_headers = {**auth_headers, **headers}
+        else:
+            request_headers = auth_headers
 
-        url = f"{self.base_url}/{endpoint}"
+        kwargs = {"headers": request_headers, "params": params}
+        if method in ("POST", "PUT") and data is not None:
+            kwargs["content"] = orjson.dumps(data)
 
-        try:
-            if method == "GET":
-                response = await client.get(
-                    url, headers=request_headers, params=params
-                )
-            elif method == "POST":
-                response = await client.post(
-                    url, headers=request_headers, json=data
+        _, _, buffer = await self._send_with_retry(method, endpoint, kwargs)
+        if not parse_response:
+            return None
+        return orjson.loads(buffer) if buffer else None
+
+    async def get_conditional(
+        self,
+        endpoint: str,
+        etag: str | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Make a GET request with ETag revalidation.
+
+        Sends If-None-Match when an etag is supplied. On 304 Not
+        Modified the body is empty and (None, etag) is returned so the
+        caller can reuse its cached copy.
+
+        Args:
+            endpoint: API endpoint
+            etag: ETag from a previous fetch of this resource
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            tuple[dict[str, Any] | None, str | None]: Parsed body (or
+                None on 304) and the response's ETag
+
+        Raises:
+            GmailAPIError: When API returns an error
+            GmailRequestError: When HTTP request fails
+        """
+        auth_headers = await self.authenticator.get_auth_headers_async()
+        request_headers = {**auth_headers, **(headers or {})}
+        if etag:
+            request_headers["If-None-Match"] = etag
+
+        kwargs = {"headers": request_headers, "params": params}
+
+        status_code, response_headers, buffer = await self._send_with_retry(
+            "GET", endpoint, kwargs, ok_statuses=(304,)
+        )
+        if status_code == 304:
+            return None, etag
+        return (
+            orjson.loads(buffer) if buffer else None,
+            response_headers.get("ETag"),
+        )
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+        ok_statuses: tuple[int, ...] = (),
+    ) -> tuple[int, httpx.Headers, bytearray]:
+        """
+        Send a request, retrying transient HTTP errors with backoff.
+
+        Args:
+            method: HTTP method
+            url: Request URL, relative to the client's base_url
+                (absolute URLs pass through unchanged)
+            kwargs: Keyword arguments for the underlying stream call
+            ok_statuses: Extra statuses to return without raising
+                (their bodies are not read)
+
+        Returns:
+            tuple[int, httpx.Headers, bytearray]: Status code,
+                response headers, and accumulated body
+
+        Raises:
+            GmailAPIError: When API returns an error
+            GmailRequestError: When HTTP request fails
+        """
+        client = self._get_client()
+        reauthed = False
+        prev_delay = RETRY_BASE_DELAY
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self._sem:
+                    async with client.stream(method, url, **kwargs) as response:
+                        if response.status_code in ok_statuses:
+                            return (
+                                response.status_code,
+                                response.headers,
+                                bytearray(),
+                            )
+                        buffer = await self._stream_body(response)
+
+                return response.status_code, response.headers, buffer
+
+            except httpx.HTTPStatusError as exc:
+                status_code = exc.response.status_code
+                if (
+                    status_code == 401
+                    and not reauthed
+                    and attempt < self.max_retries - 1
+                ):
+                    # The cached token was rejected early; rebuild the
+                    # auth headers once and retry.
+                    reauthed = True
+                    self.authenticator.invalidate_headers()
+                    fresh = await self.authenticator.get_auth_headers_async()
+                    kwargs["headers"] = {
+                        **(kwargs.get("headers") or {}),
+                        **fresh,
+                    }
+                    continue
+                if (
+                    status_code in RETRY_STATUS_CODES
+                    and attempt < self.max_retries - 1
+                ):
+                    # Decorrelated jitter: each delay is drawn from
+                    # [base, 3 * previous delay], which desynchronizes
+                    # concurrent retriers far better than exponential
+                    # steps sharing the same schedule.
+                    retry_after = _parse_retry_after(
+                        exc.response.headers.get("Retry-After")
+                    )
+                    prev_delay = min(
+                        RETRY_MAX_DELAY,
+                        random.uniform(RETRY_BASE_DELAY, prev_delay * 3),
+                    )
+                    delay = max(retry_after, prev_delay)
+                    logger.warning(
+                        f"Transient HTTP {status_code} for "
+                        f"{exc.request.url}; retrying in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                error_msg = (
+                    f"HTTP error for {exc.request.url} - "
+                    f"{status_code} - {exc.response.text}"
                 )
-            elif method == "PUT":
-                response = await client.put(
-                    url, headers=request_headers, json=data
+                logger.error(error_msg)
+                raise GmailAPIError(
+                    error_msg,
+                    status_code=status_code,
+                    response=exc.response.text,
                 )
-            elif method == "DELETE":
-                response = await client.delete(url, headers=request_headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            except httpx.RequestError as exc:
+                error_msg = f"Request error for {exc.request.url}: {exc}"
+                logger.error(error_msg)
+                raise GmailRequestError(error_msg)
 
-            response.raise_for_status()
-            return response.json()
+    async def batch_get(
+        self,
+        endpoints: list[str],
+        headers: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch multiple resources in batched requests.
+
+        Endpoints are chunked into groups of at most 100 (the Gmail
+        batch limit) and each chunk is sent as a single multipart/mixed
+        POST instead of one GET per resource.
+
+        Args:
+            endpoints: Relative API endpoints to GET
+            headers: Additional headers for each subrequest
+
+        Returns:
+            list[dict[str, Any]]: Parsed responses, one per endpoint
+
+        Raises:
+            GmailAPIError: When API returns an error
+            GmailRequestError: When HTTP request fails
+        """
+        chunks = [
+            endpoints[i : i + BATCH_MAX_REQUESTS]
+            for i in range(0, len(endpoints), BATCH_MAX_REQUESTS)
+        ]
+        chunk_results = await asyncio.gather(
+            *(self._batch_get_chunk(chunk, headers) for chunk in chunks)
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+    async def _batch_get_chunk(
+        self,
+        endpoints: list[str],
+        headers: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Send a single multipart/mixed batch of GET subrequests.
+
+        Args:
+            endpoints: Relative API endpoints to GET (at most 100)
+            headers: Additional headers for each subrequest
+
+        Returns:
+            list[dict[str, Any]]: Parsed responses, one per endpoint
+        """
+        client = self._get_client()
+        auth_headers = await self.authenticator.get_auth_headers_async()
+        base_path = httpx.URL(self.base_url).path
+        boundary = f"batch_{uuid.uuid4().hex}"
+
+        sub_headers = {"Authorization": auth_headers["Authorization"]}
+        if headers:
+            sub_headers.update(headers)
+        header_lines = "".join(
+            f"{name}: {value}\r\n" for name, value in sub_headers.items()
+        )
+
+        parts = [
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{index}>\r\n\r\n"
+            f"GET {base_path}/{endpoint} HTTP/1.1\r\n"
+            f"{header_lines}\r\n"
+            for index, endpoint in enumerate(endpoints)
+        ]
+        body = "".join(parts) + f"--{boundary}--\r\n"
+
+        try:
+            async with self._sem:
+                async with client.stream(
+                    "POST",
+                    BATCH_URL,
+                    content=body.encode(),
+                    headers={
+                        "Authorization": auth_headers["Authorization"],
+                        "Content-Type": (
+                            f"multipart/mixed; boundary={boundary}"
+                        ),
+                    },
+                ) as response:
+                    buffer = await self._stream_body(response)
+            return self._parse_batch_response(
+                bytes(buffer), response.headers.get("Content-Type", "")
+            )
 
         except httpx.HTTPStatusError as exc:
             error_msg = (
@@ -118,6 +486,56 @@ class GmailHTTPClient:
             logger.error(error_msg)
             raise GmailRequestError(error_msg)
 
+    @staticmethod
+    def _parse_batch_response(
+        content: bytes, content_type: str
+    ) -> list[dict[str, Any]]:
+        """
+        Parse a multipart/mixed batch response into per-request data.
+
+        Args:
+            content: Raw batch response body from the Gmail API
+            content_type: The batch response's Content-Type header
+
+        Returns:
+            list[dict[str, Any]]: Parsed subresponse bodies, ordered
+                by each part's Content-ID to match the request order
+
+        Raises:
+            GmailAPIError: When a subresponse has an error status
+        """
+        blob = f"Content-Type: {content_type}\r\n\r\n".encode() + content
+        message = BytesParser().parsebytes(blob)
+
+        results = []
+        for position, part in enumerate(message.get_payload()):
+            payload = part.get_payload(decode=True)
+            if payload is None:
+                payload = str(part.get_payload()).encode()
+
+            head, _, body = payload.partition(b"\r\n\r\n")
+            status_line = head.split(b"\r\n", 1)[0]
+            status_code = int(status_line.split(b" ")[1])
+            if status_code >= 400:
+                error_msg = (
+                    f"HTTP error in batch subresponse - "
+                    f"{status_code} - {body.decode(errors='replace')}"
+                )
+                logger.error(error_msg)
+                raise GmailAPIError(
+                    error_msg,
+                    status_code=status_code,
+                    response=body.decode(errors="replace"),
+                )
+            # Gmail echoes each subrequest's Content-ID back as
+            # "response-<id>"; use it to restore request order.
+            match = _CONTENT_ID_RE.search(part.get("Content-ID", ""))
+            order = int(match.group(1)) if match else position
+            results.append((order, orjson.loads(body)))
+
+        results.sort(key=lambda pair: pair[0])
+        return [data for _, data in results]
+
     async def get(
         self,
         endpoint: str,
@@ -134,9 +552,16 @@ class GmailHTTPClient:
         endpoint: str,
         data: dict[str, Any],
         headers: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
+        parse_response: bool = True,
+    ) -> dict[str, Any] | None:
         """Make a POST request."""
-        return await self.request("POST", endpoint, data=data, headers=headers)
+        return await self.request(
+            "POST",
+            endpoint,
+            data=data,
+            headers=headers,
+            parse_response=parse_response,
+        )
 
     async def put(
         self,
@@ -153,10 +578,21 @@ class GmailHTTPClient:
         headers: dict[str, str] | None = None,
     ) -> None:
         """Make a DELETE request."""
-        await self.request("DELETE", endpoint, headers=headers)
+        await self.request(
+            "DELETE", endpoint, headers=headers, parse_response=False
+        )
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
+        """
+        Release this instance's HTTP client.
+
+        Clients on the shared transport are just dropped - aclose()
+        would tear down the pooled connections other instances are
+        still using. Proxied clients own their transport and are
+        closed for real. Call aclose_shared_transport() at process
+        shutdown to release the shared pool.
+        """
+        if self._client is not None:
+            if self._owns_transport:
+                await self._client.aclose()
             self._client = None
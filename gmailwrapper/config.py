@@ -5,9 +5,15 @@ Configuration for Gmail Wrapper.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GmailConfig:
-    """Gmail API configuration."""
+    """
+    Gmail API configuration.
+
+    Frozen with slots so instances are hashable, attribute access skips
+    the instance __dict__, and a single shared instance can be reused
+    safely across callers.
+    """
 
     BASE_URL: str = "https://gmail.googleapis.com/gmail/v1/users/me"
 
@@ -23,3 +29,25 @@ class GmailConfig:
 
     # Request formats
     FULL_FORMAT: str = "full"
+
+    # Partial-response field masks (server-side projection)
+    FIELDS_SUMMARY: str = "id,snippet,payload/headers(name,value),internalDate"
+    FIELDS_ID_ONLY: str = "id,threadId"
+
+    # Pagination
+    MAX_PAGE_SIZE: int = 500
+
+    # Concurrency cap for per-resource fan-outs
+    MAX_CONCURRENT_REQUESTS: int = 10
+
+    # Retry budget for transient HTTP errors
+    MAX_RETRIES: int = 6
+
+    # In-process detail cache
+    DETAIL_CACHE_SIZE: int = 4096
+    DETAIL_CACHE_TTL: int = 300
+    ETAG_CACHE_SIZE: int = 1024
+
+
+#: Shared default configuration; immutable, so safe to reuse everywhere.
+DEFAULT_CONFIG = GmailConfig()
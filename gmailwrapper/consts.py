@@ -14,3 +14,7 @@ CREDENTIALS_PATH = (Path(BACKEND_DIR) / "credentials.json").resolve()
 EMAIL_SIGNATURE = os.environ.get("EMAIL_SIGNATURE", "")
 
 FLOW_PORT = int(os.environ.get("FLOW_PORT", 5000))
+
+GMAIL_POOL = int(os.environ.get("GMAIL_POOL", 100))
+
+GMAIL_CONCURRENCY = int(os.environ.get("GMAIL_CONCURRENCY", 25))
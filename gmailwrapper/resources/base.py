@@ -3,8 +3,13 @@ Base class for Gmail resources.
 """
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Mapping
+from types import MappingProxyType
 from typing import Any
 
+from cachetools import TTLCache
+
 from ..client import GmailHTTPClient
 from ..config import GmailConfig
 from ..exceptions import GmailResourceError
@@ -28,6 +33,23 @@ class BaseGmailResource:
         """
         self.client = client
         self.config = config
+        self._detail_cache = TTLCache(
+            maxsize=config.DETAIL_CACHE_SIZE, ttl=config.DETAIL_CACHE_TTL
+        )
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._sem = asyncio.Semaphore(config.MAX_CONCURRENT_REQUESTS)
+        # Maps detail-cache keys to (etag, payload) for conditional
+        # GET revalidation after the TTL cache expires.
+        self._etag_cache: OrderedDict[tuple, tuple[str, dict]] = OrderedDict()
+        # Precompiled path templates; resolves the config suffix
+        # lookups once instead of per delete/undelete call.
+        self._trash_template = f"%s/%s/{config.TRASH_SUFFIX}"
+        self._untrash_template = f"%s/%s/{config.UNTRASH_SUFFIX}"
+        # Built once and read-only, so get_by_id callers can pass it
+        # straight through without rebuilding {"format": ...} per call.
+        self._full_format_params = MappingProxyType(
+            {"format": config.FULL_FORMAT}
+        )
 
     async def get_all(
         self,
@@ -35,6 +57,7 @@ class BaseGmailResource:
         list_key: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all resources of a type.
@@ -44,10 +67,13 @@ class BaseGmailResource:
             list_key: Key for list in response
             params: Query parameters
             headers: Additional headers
+            fields: Partial-response field mask
 
         Returns:
             list[dict[str, Any]]: List of resources
         """
+        if fields:
+            params = {**(params or {}), "fields": fields}
         try:
             response = await self.client.get(
                 endpoint, params=params, headers=headers
@@ -56,12 +82,80 @@ class BaseGmailResource:
         except Exception as e:
             raise GmailResourceError(f"Failed to get {endpoint}: {e}")
 
+    async def iter_all(
+        self,
+        endpoint: str,
+        list_key: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterate over all pages of a resource listing.
+
+        The request for page N+1 is issued while the caller is still
+        consuming page N, hiding one round trip per page. Pages are
+        requested at the Gmail maximum size unless params overrides
+        maxResults.
+
+        Args:
+            endpoint: API endpoint
+            list_key: Key for list in response
+            params: Query parameters
+            headers: Additional headers
+
+        Yields:
+            list[dict[str, Any]]: One page of resources at a time
+        """
+        page_params = {"maxResults": self.config.MAX_PAGE_SIZE}
+        if params:
+            page_params.update(params)
+
+        try:
+            response = await self.client.get(
+                endpoint, params=page_params, headers=headers
+            )
+        except Exception as e:
+            raise GmailResourceError(f"Failed to get {endpoint}: {e}")
+
+        prefetch = None
+        try:
+            while True:
+                next_token = response.get("nextPageToken")
+                if next_token:
+                    prefetch = asyncio.create_task(
+                        self.client.get(
+                            endpoint,
+                            params={
+                                **page_params,
+                                "pageToken": next_token,
+                            },
+                            headers=headers,
+                        )
+                    )
+
+                yield response.get(list_key, [])
+
+                if prefetch is None:
+                    return
+                try:
+                    response = await prefetch
+                finally:
+                    prefetch = None
+        except GmailResourceError:
+            raise
+        except Exception as e:
+            raise GmailResourceError(f"Failed to get {endpoint}: {e}")
+        finally:
+            if prefetch is not None and not prefetch.done():
+                prefetch.cancel()
+
     async def get_by_id(
         self,
         endpoint: str,
         resource_id: str,
-        params: dict[str, Any] | None = None,
+        params: Mapping[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """
         Get a specific resource by ID.
@@ -71,19 +165,93 @@ class BaseGmailResource:
             resource_id: Resource ID
             params: Query parameters
             headers: Additional headers
+            fields: Partial-response field mask
 
         Returns:
             dict[str, Any]: Resource data
         """
+        if fields:
+            params = {**(params or {}), "fields": fields}
+
+        # Detail payloads are immutable once fetched, so repeat
+        # lookups within the TTL are served from the cache, and
+        # concurrent lookups for the same key coalesce onto one
+        # in-flight request. Calls with custom headers bypass both.
+        cache_key = (
+            endpoint,
+            resource_id,
+            (params or {}).get("format"),
+            fields,
+        )
+        fetch_key = cache_key if headers is None else None
+
+        if fetch_key is not None:
+            cached = self._detail_cache.get(fetch_key)
+            if cached is not None:
+                return cached
+
+            pending = self._inflight.get(fetch_key)
+            if pending is not None:
+                return await pending
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[fetch_key] = future
+
+        etag_entry = (
+            self._etag_cache.get(cache_key) if fetch_key is not None else None
+        )
+        etag = etag_entry[0] if etag_entry else None
+
         try:
             full_endpoint = f"{endpoint}/{resource_id}"
-            return await self.client.get(
-                full_endpoint, params=params, headers=headers
+            result, new_etag = await self.client.get_conditional(
+                full_endpoint, etag=etag, params=params, headers=headers
             )
+            if result is None and etag_entry is not None:
+                # 304 Not Modified: the cached payload is still good.
+                result = etag_entry[1]
+                new_etag = etag
+
+            if fetch_key is not None:
+                self._detail_cache[fetch_key] = result
+                if new_etag:
+                    self._etag_cache[cache_key] = (new_etag, result)
+                    self._etag_cache.move_to_end(cache_key)
+                    if len(self._etag_cache) > self.config.ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+                future.set_result(result)
         except Exception as e:
-            raise GmailResourceError(
+            error = GmailResourceError(
                 f"Failed to get {endpoint}/{resource_id}: {e}"
             )
+            if fetch_key is not None:
+                future.set_exception(error)
+                # Mark retrieved so an un-awaited future doesn't log
+                # "exception was never retrieved".
+                future.exception()
+            raise error
+        finally:
+            # Runs on every exit, including CancelledError, which the
+            # except clause above never sees. Without this, a
+            # cancelled fetch leaves its unresolved future in
+            # _inflight and later callers for the key await it
+            # forever.
+            if fetch_key is not None:
+                self._inflight.pop(fetch_key, None)
+                if not future.done():
+                    future.cancel()
+        return result
+
+    def _invalidate_detail_cache(self, endpoint: str, resource_id: str) -> None:
+        """Drop cached detail and ETag entries for a resource."""
+        for cache in (self._detail_cache, self._etag_cache):
+            stale_keys = [
+                key
+                for key in cache
+                if key[0] == endpoint and key[1] == resource_id
+            ]
+            for key in stale_keys:
+                cache.pop(key, None)
 
     async def create(
         self,
@@ -128,7 +296,7 @@ class BaseGmailResource:
         """
         try:
             full_endpoint = f"{endpoint}/{resource_id}"
-            return await self.client.put(
+            result = await self.client.put(
                 full_endpoint, data=data, headers=headers
             )
         except Exception as e:
@@ -136,6 +304,9 @@ class BaseGmailResource:
                 f"Failed to update {endpoint}/{resource_id}: {e}"
             )
 
+        self._invalidate_detail_cache(endpoint, resource_id)
+        return result
+
     async def delete(
         self,
         endpoint: str,
@@ -151,15 +322,15 @@ class BaseGmailResource:
             headers: Additional headers
         """
         try:
-            full_endpoint = (
-                f"{endpoint}/{resource_id}/{self.config.TRASH_SUFFIX}"
-            )
+            full_endpoint = self._trash_template % (endpoint, resource_id)
             await self.client.delete(full_endpoint, headers=headers)
         except Exception as e:
             raise GmailResourceError(
                 f"Failed to delete {endpoint}/{resource_id}: {e}"
             )
 
+        self._invalidate_detail_cache(endpoint, resource_id)
+
     async def undelete(
         self,
         endpoint: str,
@@ -175,15 +346,80 @@ class BaseGmailResource:
             headers: Additional headers
         """
         try:
-            full_endpoint = (
-                f"{endpoint}/{resource_id}/{self.config.UNTRASH_SUFFIX}"
+            full_endpoint = self._untrash_template % (
+                endpoint,
+                resource_id,
+            )
+            # The untrash response echoes the full resource; nobody
+            # reads it here, so skip the parse.
+            await self.client.post(
+                full_endpoint,
+                data={},
+                headers=headers,
+                parse_response=False,
             )
-            await self.client.post(full_endpoint, data={}, headers=headers)
         except Exception as e:
             raise GmailResourceError(
                 f"Failed to undelete {endpoint}/{resource_id}: {e}"
             )
 
+        self._invalidate_detail_cache(endpoint, resource_id)
+
+    async def bulk_get(
+        self,
+        ids: list[str],
+        concurrency: int = 25,
+        queue_size: int = 100,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream details for many IDs with bounded memory.
+
+        A producer feeds IDs through a bounded queue into a fixed pool
+        of workers, and results are yielded as they complete, so
+        memory stays flat at roughly queue_size payloads no matter how
+        many IDs are requested. Relies on the subclass get_by_id
+        signature (resource_id, headers).
+
+        Args:
+            ids: Resource IDs to fetch
+            concurrency: Number of concurrent workers
+            queue_size: Bound on queued IDs and results
+            headers: Additional headers
+
+        Yields:
+            dict[str, Any]: Detailed resources, in completion order
+        """
+        in_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        out_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        async def produce():
+            for resource_id in ids:
+                await in_queue.put(resource_id)
+
+        async def work():
+            while True:
+                resource_id = await in_queue.get()
+                try:
+                    result = await self.get_by_id(resource_id, headers=headers)
+                except Exception as e:
+                    await out_queue.put(e)
+                else:
+                    await out_queue.put(result)
+
+        producer = asyncio.create_task(produce())
+        workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+        try:
+            for _ in range(len(ids)):
+                result = await out_queue.get()
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        finally:
+            producer.cancel()
+            for worker in workers:
+                worker.cancel()
+
     async def get_all_with_details(
         self,
         endpoint: str,
@@ -191,6 +427,7 @@ class BaseGmailResource:
         get_detail_func,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all resources with full details.
@@ -201,21 +438,136 @@ class BaseGmailResource:
             get_detail_func: Function to get detailed resource
             params: Query parameters
             headers: Additional headers
+            fields: Partial-response field mask for detail fetches
 
         Returns:
             list[dict[str, Any]]: List of detailed resources
         """
-        resources = await self.get_all(
-            endpoint, list_key, params=params, headers=headers
+        # Subclasses override get_all with resource-specific
+        # signatures (no endpoint/list_key), so dispatch to the base
+        # implementation explicitly.
+        resources = await BaseGmailResource.get_all(
+            self, endpoint, list_key, params=params, headers=headers
         )
 
         if not resources:
             return []
 
-        tasks = [
-            asyncio.create_task(
-                get_detail_func(resource.get("id"), headers=headers)
+        return await self._get_details(
+            endpoint,
+            resources,
+            get_detail_func,
+            headers=headers,
+            fields=fields,
+        )
+
+    async def iter_all_with_details(
+        self,
+        endpoint: str,
+        list_key: str,
+        get_detail_func,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream detailed resources across all pages.
+
+        Pages come from iter_all, which prefetches page N+1 while page
+        N's details are being batch-fetched, so the list and detail
+        round trips overlap instead of serializing. Unlike
+        get_all_with_details, this never holds more than one page of
+        payloads in memory.
+
+        Args:
+            endpoint: API endpoint
+            list_key: Key for list in response
+            get_detail_func: Function to get detailed resource
+            params: Query parameters
+            headers: Additional headers
+            fields: Partial-response field mask for detail fetches
+
+        Yields:
+            dict[str, Any]: Detailed resources, page by page
+        """
+        # Subclasses override iter_all with resource-specific
+        # signatures (no endpoint/list_key), so dispatch to the base
+        # implementation explicitly.
+        pages = BaseGmailResource.iter_all(
+            self, endpoint, list_key, params=params, headers=headers
+        )
+        async for page in pages:
+            if not page:
+                continue
+            details = await self._get_details(
+                endpoint,
+                page,
+                get_detail_func,
+                headers=headers,
+                fields=fields,
+            )
+            for detail in details:
+                yield detail
+
+    async def _get_details(
+        self,
+        endpoint: str,
+        resources: list[dict[str, Any]],
+        get_detail_func,
+        headers: dict[str, str] | None = None,
+        fields: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch full details for listed resources.
+
+        Tries a single batch request first and falls back to bounded
+        per-ID fetches, logging and skipping individual failures.
+
+        Args:
+            endpoint: API endpoint
+            resources: Listed resources with at least an "id" key
+            get_detail_func: Function to get detailed resource
+            headers: Additional headers
+            fields: Partial-response field mask for detail fetches
+
+        Returns:
+            list[dict[str, Any]]: Detailed resources
+        """
+        try:
+            detail_query = f"?format={self.config.FULL_FORMAT}"
+            if fields:
+                detail_query += f"&fields={fields}"
+            detail_endpoints = [
+                f"{endpoint}/{resource.get('id')}{detail_query}"
+                for resource in resources
+            ]
+            return await self.client.batch_get(
+                detail_endpoints, headers=headers
             )
-            for resource in resources
-        ]
-        return await asyncio.gather(*tasks)
+        except Exception as e:
+            logger.warning(
+                f"Batch detail fetch for {endpoint} failed, "
+                f"falling back to per-ID requests: {e}"
+            )
+
+        async def _bounded(resource_id):
+            async with self._sem:
+                return await get_detail_func(
+                    resource_id, headers=headers, fields=fields
+                )
+
+        results = await asyncio.gather(
+            *(_bounded(resource.get("id")) for resource in resources),
+            return_exceptions=True,
+        )
+
+        details = []
+        for resource, result in zip(resources, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"Detail fetch for {endpoint}/{resource.get('id')} "
+                    f"failed: {result}"
+                )
+            else:
+                details.append(result)
+        return details
@@ -2,15 +2,94 @@
 Gmail messages resource.
 """
 
+import asyncio
 import base64
 import email
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import re
+import secrets
+from collections.abc import AsyncIterator
+from email import policy
+from email.header import Header
+from email.parser import BytesParser
+from email.utils import (
+    formataddr,
+    formatdate,
+    getaddresses,
+    make_msgid,
+)
 from typing import Any
 
 from .base import BaseGmailResource
 
 
+def _encode_header_value(value: str) -> str:
+    """
+    Validate and encode a free-form header value.
+
+    Rejects CR/LF to block header injection and RFC-2047-encodes
+    non-ASCII values, matching what the replaced MIME stack produced.
+
+    Args:
+        value: Header value to encode
+
+    Returns:
+        str: The value, encoded-word wrapped if non-ASCII
+
+    Raises:
+        ValueError: When the value contains line breaks
+    """
+    if "\r" in value or "\n" in value:
+        raise ValueError(
+            f"Header value must not contain line breaks: {value!r}"
+        )
+    try:
+        value.encode("ascii")
+    except UnicodeEncodeError:
+        return Header(value, "utf-8").encode()
+    return value
+
+
+def _encode_address(value: str) -> str:
+    """
+    Validate and encode an address header value.
+
+    Accepts a single mailbox or a comma-separated list of them, as
+    the To/Cc headers always did. Each mailbox is split into display
+    name and addr-spec so formataddr can quote or RFC-2047-encode the
+    name while the address itself stays plain ASCII.
+
+    Args:
+        value: Address or comma-separated addresses, each optionally
+            with a display name
+
+    Returns:
+        str: Formatted address list
+
+    Raises:
+        ValueError: On line breaks or when no mailbox can be parsed
+    """
+    if "\r" in value or "\n" in value:
+        raise ValueError(f"Address must not contain line breaks: {value!r}")
+    # getaddresses also yields bare words from malformed input, so
+    # only mailboxes with an actual addr-spec count as valid.
+    mailboxes = [
+        (name, addr) for name, addr in getaddresses([value]) if "@" in addr
+    ]
+    if not mailboxes:
+        raise ValueError(f"Invalid address: {value!r}")
+    return ", ".join(formataddr(mailbox) for mailbox in mailboxes)
+
+
+# Reusable parser; policy=default yields EmailMessage objects with
+# proper header decoding and supports header-only parsing.
+_BYTES_PARSER = BytesParser(policy=policy.default)
+
+# Top-level RFC 5322 header lines; folded continuation lines are
+# intentionally not matched (see extract_headers).
+_HEADER_RE = re.compile(rb"^([A-Za-z0-9-]+):[ \t]*(.*?)\r?$", re.M)
+_HEADER_SCAN_BYTES = 8192
+
+
 class GmailMessages(BaseGmailResource):
     """Handles Gmail message operations."""
 
@@ -19,6 +98,7 @@ class GmailMessages(BaseGmailResource):
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         details: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all messages.
@@ -27,6 +107,7 @@ class GmailMessages(BaseGmailResource):
             params: Query parameters
             headers: Additional headers
             details: Whether to get full message details
+            fields: Partial-response field mask
 
         Returns:
             list[dict[str, Any]]: List of messages
@@ -38,6 +119,7 @@ class GmailMessages(BaseGmailResource):
                 self.get_by_id,
                 params=params,
                 headers=headers,
+                fields=fields,
             )
         else:
             return await super().get_all(
@@ -45,12 +127,62 @@ class GmailMessages(BaseGmailResource):
                 "messages",
                 params=params,
                 headers=headers,
+                fields=fields,
             )
 
+    def iter_all(
+        self,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterate over all message pages.
+
+        Args:
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            AsyncIterator[list[dict[str, Any]]]: Pages of messages
+        """
+        return super().iter_all(
+            self.config.MESSAGES_ENDPOINT,
+            "messages",
+            params=params,
+            headers=headers,
+        )
+
+    def iter_all_with_details(
+        self,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream detailed messages across all pages.
+
+        Args:
+            params: Query parameters
+            headers: Additional headers
+            fields: Partial-response field mask
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: Detailed messages
+        """
+        return super().iter_all_with_details(
+            self.config.MESSAGES_ENDPOINT,
+            "messages",
+            self.get_by_id,
+            params=params,
+            headers=headers,
+            fields=fields,
+        )
+
     async def get_by_id(
         self,
         message_id: str,
         headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """
         Get a specific message by ID.
@@ -58,16 +190,17 @@ class GmailMessages(BaseGmailResource):
         Args:
             message_id: Message ID
             headers: Additional headers
+            fields: Partial-response field mask
 
         Returns:
             dict[str, Any]: Message data
         """
-        params = {"format": self.config.FULL_FORMAT}
         return await super().get_by_id(
             self.config.MESSAGES_ENDPOINT,
             message_id,
-            params=params,
+            params=self._full_format_params,
             headers=headers,
+            fields=fields,
         )
 
     async def send(
@@ -129,8 +262,8 @@ class GmailMessages(BaseGmailResource):
             headers=headers,
         )
 
+    @staticmethod
     def create_message(
-        self,
         sender: str,
         to: str,
         subject: str,
@@ -141,6 +274,11 @@ class GmailMessages(BaseGmailResource):
         """
         Create a message for sending.
 
+        Assembles the RFC 5322 payload directly rather than going
+        through the email.mime generator stack, which is measurably
+        slower per message on bulk send paths. Plain-text messages
+        skip multipart framing entirely.
+
         Args:
             sender: Sender email
             to: Recipient email
@@ -151,38 +289,132 @@ class GmailMessages(BaseGmailResource):
 
         Returns:
             dict[str, str]: Message data ready for sending
+
+        Raises:
+            ValueError: When a header input contains line breaks or
+                an address cannot be parsed
         """
-        message = MIMEMultipart("alternative")
-        message["to"] = to
-        message["from"] = sender
-        message["subject"] = subject
+        headers = [
+            f"To: {_encode_address(to)}",
+            f"From: {_encode_address(sender)}",
+            f"Subject: {_encode_header_value(subject)}",
+            f"Date: {formatdate(localtime=True)}",
+            f"Message-ID: {make_msgid()}",
+            "MIME-Version: 1.0",
+        ]
 
         if cc:
             if isinstance(cc, str):
                 cc = [cc]
-            message["Cc"] = ", ".join(cc)
-
-        part1 = MIMEText(message_text, "plain")
-        message.attach(part1)
+            cc_value = ", ".join(_encode_address(address) for address in cc)
+            headers.append(f"Cc: {cc_value}")
 
-        if message_html:
-            part2 = MIMEText(message_html, "html")
-            message.attach(part2)
+        if message_html is None:
+            headers.append('Content-Type: text/plain; charset="utf-8"')
+            headers.append("Content-Transfer-Encoding: 8bit")
+            raw = "\r\n".join(headers) + "\r\n\r\n" + message_text
+        else:
+            boundary = secrets.token_hex(16)
+            headers.append(
+                f'Content-Type: multipart/alternative; boundary="{boundary}"'
+            )
+            raw = (
+                "\r\n".join(headers) + "\r\n\r\n"
+                f"--{boundary}\r\n"
+                'Content-Type: text/plain; charset="utf-8"\r\n'
+                "Content-Transfer-Encoding: 8bit\r\n\r\n"
+                f"{message_text}\r\n"
+                f"--{boundary}\r\n"
+                'Content-Type: text/html; charset="utf-8"\r\n'
+                "Content-Transfer-Encoding: 8bit\r\n\r\n"
+                f"{message_html}\r\n"
+                f"--{boundary}--\r\n"
+            )
 
-        return {"raw": base64.urlsafe_b64encode(message.as_bytes()).decode()}
+        return {"raw": base64.urlsafe_b64encode(raw.encode("utf-8")).decode()}
 
     def parse_message(self, raw_content: str) -> email.message.Message:
         """
         Parse raw message content.
 
         Args:
-            raw_content: Raw message content
+            raw_content: Raw URL-safe base64 message content
 
         Returns:
             email.message.Message: Parsed message object
         """
-        raw_content = raw_content.replace("_", "/").replace("-", "+")
-        email_msg = base64.urlsafe_b64decode(
-            raw_content.encode("ASCII")
-        ).decode("ASCII")
-        return email.message_from_string(email_msg)
+        return email.message_from_bytes(base64.urlsafe_b64decode(raw_content))
+
+    @staticmethod
+    def parse_message_fast(
+        raw_content: str, headers_only: bool = False
+    ) -> email.message.EmailMessage:
+        """
+        Parse raw message content with the modern parser.
+
+        Uses a shared BytesParser with policy=default, which returns
+        EmailMessage objects with decoded headers. With headers_only
+        the body is left as an unparsed payload, which skips MIME tree
+        construction entirely - the dominant cost when only envelope
+        data (From/To/Subject/Date) is needed.
+
+        Args:
+            raw_content: Raw URL-safe base64 message content
+            headers_only: Skip parsing the body/MIME structure
+
+        Returns:
+            email.message.EmailMessage: Parsed message object
+        """
+        return _BYTES_PARSER.parsebytes(
+            base64.urlsafe_b64decode(raw_content),
+            headersonly=headers_only,
+        )
+
+    @staticmethod
+    def extract_headers(raw_content: str) -> dict[str, str]:
+        """
+        Pull top-level headers without building a message object.
+
+        Scans only the first 8KB of the decoded payload with a regex,
+        stopping at the blank line that ends the header block. Folded
+        (multi-line) header values are truncated at the first line, so
+        this suits triage loops keying on Subject/From/Date; use
+        parse_message_fast when full header fidelity matters.
+
+        Args:
+            raw_content: Raw URL-safe base64 message content
+
+        Returns:
+            dict[str, str]: Header names mapped to first-line values
+        """
+        head = base64.urlsafe_b64decode(raw_content)[:_HEADER_SCAN_BYTES]
+        for separator in (b"\r\n\r\n", b"\n\n"):
+            end = head.find(separator)
+            if end != -1:
+                head = head[:end]
+                break
+        return {
+            name.decode("ascii"): value.decode("utf-8", "replace")
+            for name, value in _HEADER_RE.findall(head)
+        }
+
+    async def parse_message_async(
+        self, raw_content: str
+    ) -> email.message.Message:
+        """
+        Parse raw message content without blocking the event loop.
+
+        Message parsing is pure-Python CPU work that can take several
+        milliseconds for a large multipart payload; running it in the
+        default thread executor lets bulk decodes overlap with network
+        I/O instead of serializing on the event loop.
+
+        Args:
+            raw_content: Raw URL-safe base64 message content
+
+        Returns:
+            email.message.Message: Parsed message object
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.parse_message, raw_content
+        )
@@ -2,6 +2,7 @@
 Gmail threads resource.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from .base import BaseGmailResource
@@ -15,6 +16,7 @@ class GmailThreads(BaseGmailResource):
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         details: bool = False,
+        fields: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all threads.
@@ -23,6 +25,7 @@ class GmailThreads(BaseGmailResource):
             params: Query parameters
             headers: Additional headers
             details: Whether to get full thread details
+            fields: Partial-response field mask
 
         Returns:
             list[dict[str, Any]]: List of threads
@@ -34,6 +37,7 @@ class GmailThreads(BaseGmailResource):
                 self.get_by_id,
                 params=params,
                 headers=headers,
+                fields=fields,
             )
         else:
             return await super().get_all(
@@ -41,12 +45,62 @@ class GmailThreads(BaseGmailResource):
                 "threads",
                 params=params,
                 headers=headers,
+                fields=fields,
             )
 
+    def iter_all(
+        self,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterate over all thread pages.
+
+        Args:
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            AsyncIterator[list[dict[str, Any]]]: Pages of threads
+        """
+        return super().iter_all(
+            self.config.THREADS_ENDPOINT,
+            "threads",
+            params=params,
+            headers=headers,
+        )
+
+    def iter_all_with_details(
+        self,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream detailed threads across all pages.
+
+        Args:
+            params: Query parameters
+            headers: Additional headers
+            fields: Partial-response field mask
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: Detailed threads
+        """
+        return super().iter_all_with_details(
+            self.config.THREADS_ENDPOINT,
+            "threads",
+            self.get_by_id,
+            params=params,
+            headers=headers,
+            fields=fields,
+        )
+
     async def get_by_id(
         self,
         thread_id: str,
         headers: dict[str, str] | None = None,
+        fields: str | None = None,
     ) -> dict[str, Any]:
         """
         Get a specific thread by ID.
@@ -54,16 +108,17 @@ class GmailThreads(BaseGmailResource):
         Args:
             thread_id: Thread ID
             headers: Additional headers
+            fields: Partial-response field mask
 
         Returns:
             dict[str, Any]: Thread data
         """
-        params = {"format": self.config.FULL_FORMAT}
         return await super().get_by_id(
             self.config.THREADS_ENDPOINT,
             thread_id,
-            params=params,
+            params=self._full_format_params,
             headers=headers,
+            fields=fields,
         )
 
     async def delete(